@@ -42,6 +42,9 @@ COMMODITY_FUTURES_MAP = {
 # Legacy set for backward compatibility
 COMMODITIES = set(COMMODITY_FUTURES_MAP.keys())
 
+# Shared HTTP session so consecutive Telegram calls reuse the TLS connection
+_telegram_session = requests.Session()
+
 
 def send_telegram_photo(chat_id: str, photo_bytes: bytes, caption: str = None) -> bool:
     """Send a photo to Telegram.
@@ -65,7 +68,7 @@ def send_telegram_photo(chat_id: str, photo_bytes: bytes, caption: str = None) -
         data["parse_mode"] = "Markdown"
 
     try:
-        response = requests.post(url, data=data, files=files)
+        response = _telegram_session.post(url, data=data, files=files)
         if response.ok:
             return True
         print(f"Telegram sendPhoto error: {response.status_code} - {response.text[:200]}")
@@ -102,7 +105,7 @@ def send_telegram_message(chat_id: str, text: str) -> bool:
 
     success = True
     for i, msg in enumerate(messages):
-        response = requests.post(url, json={
+        response = _telegram_session.post(url, json={
             "chat_id": chat_id,
             "text": msg,
             "parse_mode": "Markdown",
@@ -112,7 +115,7 @@ def send_telegram_message(chat_id: str, text: str) -> bool:
             print(f"Telegram API error: {response.status_code}")
             print(f"Response: {response.text[:500]}")
             # Retry without Markdown if it fails
-            response = requests.post(url, json={
+            response = _telegram_session.post(url, json={
                 "chat_id": chat_id,
                 "text": msg,
                 "disable_web_page_preview": True,
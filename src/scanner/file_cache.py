@@ -0,0 +1,99 @@
+"""Small on-disk JSON cache with per-read TTL."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class FileCache:
+    """
+    File-backed cache storing one JSON document per key.
+
+    Entries live at `<cache_dir>/<namespace>/<key>.json` and record when they
+    were written, so each caller can apply its own TTL on read. The most
+    recently used entries are also kept in memory so repeated lookups within
+    a process skip the disk read.
+    """
+
+    def __init__(self, cache_dir: str, memory_size: int = 128):
+        self.cache_dir = Path(cache_dir)
+        self.memory_size = memory_size
+        # Entries are kept serialized so every hit decodes a fresh copy callers may mutate
+        self._memory: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()  # Callers share one cache across worker threads
+
+    def _path(self, namespace: str, key: str) -> Path:
+        return self.cache_dir / namespace / f"{key}.json"
+
+    def _remember(self, namespace: str, key: str, ts: float, payload: str) -> None:
+        with self._lock:
+            self._memory[(namespace, key)] = (ts, payload)
+            self._memory.move_to_end((namespace, key))
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, namespace: str, key: str, ttl: float) -> Optional[Any]:
+        """Return the cached value, or None if missing, unreadable or older than ttl seconds."""
+        with self._lock:
+            cached = self._memory.get((namespace, key))
+            if cached is not None:
+                self._memory.move_to_end((namespace, key))
+
+        if cached is not None:
+            ts, payload = cached
+            if time.time() - ts >= ttl:
+                return None
+            return json.loads(payload).get("data")
+
+        try:
+            payload = self._path(namespace, key).read_text(encoding="utf-8")
+            entry = json.loads(payload)
+        except (OSError, ValueError):
+            return None
+        ts = entry.get("ts", 0)
+        self._remember(namespace, key, ts, payload)
+
+        if time.time() - ts >= ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a JSON-serializable value. Write errors are logged, never raised."""
+        path = self._path(namespace, key)
+        entry = {"ts": time.time(), "data": value}
+        try:
+            payload = json.dumps(entry)
+        except (TypeError, ValueError) as e:
+            logger.warning("cache_write_failed", namespace=namespace, key=key, error=str(e))
+            return
+
+        self._remember(namespace, key, entry["ts"], payload)
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so concurrent readers never see partial JSON
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                f.write(payload)
+            os.replace(tmp_name, path)
+            tmp_name = None
+        except OSError as e:
+            logger.warning("cache_write_failed", namespace=namespace, key=key, error=str(e))
+        finally:
+            # Don't leave orphaned temp files behind when the write or rename fails
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
@@ -1,17 +1,23 @@
 """GEM Finder - Identifies high-potential penny stocks."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
 import structlog
-import yfinance as yf
 
-from .reddit_scanner import RedditScanner, GemCandidate, STOCK_SUBREDDITS
+from .file_cache import FileCache
+from .reddit_scanner import RedditScanner, GemCandidate, COMMON_WORDS, STOCK_SUBREDDITS
 
 logger = structlog.get_logger()
 
+# Cache lifetimes (seconds)
+STOCK_INFO_TTL = 60 * 60  # Quotes and volume move during the day
+FINNHUB_BUZZ_TTL = 12 * 60 * 60  # Social sentiment is aggregated daily
+
+YF_BATCH_SIZE = 20  # Tickers per yf.download request
+
 
 @dataclass
 class GemStock:
@@ -44,6 +50,32 @@ class GemFinder:
     - Multiple mentions across subreddits
     """
 
+    # Telegram message labels (built once, shared by every format call)
+    _SENTIMENT_MAP = {"bullish": "🟢 Bullish", "bearish": "🔴 Bearish", "neutral": "🟡 Neutral"}
+    _SENTIMENT_EMOJI = {"bullish": "🟢", "bearish": "🔴", "neutral": "🟡"}
+    _LABELS_EN = {
+        "price": "Price",
+        "market_cap": "Market Cap",
+        "volume": "Volume",
+        "volume_spike": "Volume Spike",
+        "mentions": "Reddit Mentions",
+        "sentiment": "Sentiment",
+        "subreddits": "Found in",
+        "sector": "Sector",
+        "sample": "Sample Posts",
+    }
+    _LABELS_DE = {
+        "price": "Kurs",
+        "market_cap": "Marktkapital",
+        "volume": "Volumen",
+        "volume_spike": "Volumen-Spike",
+        "mentions": "Reddit Erwähnungen",
+        "sentiment": "Sentiment",
+        "subreddits": "Gefunden in",
+        "sector": "Sektor",
+        "sample": "Beispiel-Posts",
+    }
+
     def __init__(
         self,
         max_market_cap: float = 2_000_000_000,  # $2B
@@ -51,20 +83,36 @@ class GemFinder:
         max_price: float = 50.00,  # Focus on smaller stocks
         min_volume_spike: float = 1.5,  # 50% above average
         finnhub_api_key: Optional[str] = None,
+        max_workers: int = 8,  # Parallel yfinance/Finnhub requests
+        cache_dir: Optional[str] = None,
     ):
         self.max_market_cap = max_market_cap
         self.min_price = min_price
         self.max_price = max_price
         self.min_volume_spike = min_volume_spike
         self.finnhub_api_key = finnhub_api_key or os.getenv("FINNHUB_API_KEY")
+        self.max_workers = max_workers
+        self.cache = FileCache(cache_dir or os.getenv("GEM_CACHE_DIR", ".cache/gem_finder"))
+        self._session = None
 
         self.reddit_scanner = RedditScanner()
 
+    def _get_session(self):
+        """Get a shared requests session so Finnhub connections are reused."""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
+
     def get_finnhub_buzz(self, ticker: str) -> Optional[dict]:
         """Get social media buzz from Finnhub."""
         if not self.finnhub_api_key:
             return None
 
+        cached = self.cache.get("finnhub_buzz", ticker, FINNHUB_BUZZ_TTL)
+        if cached is not None:
+            return cached
+
         try:
             url = f"https://finnhub.io/api/v1/stock/social-sentiment"
             params = {
@@ -72,42 +120,130 @@ class GemFinder:
                 "from": "2024-01-01",
                 "token": self.finnhub_api_key,
             }
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get_session().get(url, params=params, timeout=10)
             if response.ok:
-                return response.json()
+                buzz = response.json()
+                self.cache.set("finnhub_buzz", ticker, buzz)
+                return buzz
         except Exception as e:
             logger.warning("finnhub_buzz_failed", ticker=ticker, error=str(e))
 
         return None
 
+    def get_finnhub_buzz_batch(self, tickers: list[str]) -> dict[str, dict]:
+        """Get Finnhub social buzz for many tickers concurrently."""
+        if not self.finnhub_api_key or not tickers:
+            return {}
+
+        self._get_session()  # create once before the workers share it
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self.get_finnhub_buzz, tickers)
+            return {ticker: buzz for ticker, buzz in zip(tickers, results) if buzz}
+
+    def _build_stock_info(self, ticker: str, info: dict, hist) -> Optional[dict]:
+        """Build (and cache) the stock info dict from yfinance info + 1mo history."""
+        if hist.empty or not info:
+            return None
+
+        # Calculate volume spike
+        current_volume = hist["Volume"].iloc[-1] if not hist.empty else 0
+        avg_volume = info.get("averageVolume", current_volume) or current_volume
+        volume_spike = current_volume / avg_volume if avg_volume > 0 else 1.0
+
+        stock_info = {
+            "name": info.get("shortName", ticker),
+            "price": info.get("regularMarketPrice") or info.get("previousClose", 0),
+            "market_cap": info.get("marketCap", 0),
+            "volume": int(current_volume),
+            "avg_volume": int(avg_volume),
+            "volume_spike": float(volume_spike),
+            "sector": info.get("sector", "Unknown"),
+        }
+        self.cache.set("stock_info", ticker, stock_info)
+        return stock_info
+
     def get_stock_info(self, ticker: str) -> Optional[dict]:
         """Get stock info from yfinance."""
+        cached = self.cache.get("stock_info", ticker, STOCK_INFO_TTL)
+        if cached is not None:
+            return cached
+
+        import yfinance as yf
+
         try:
             stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period="1mo")
-
-            if hist.empty or not info:
-                return None
-
-            # Calculate volume spike
-            current_volume = hist["Volume"].iloc[-1] if not hist.empty else 0
-            avg_volume = info.get("averageVolume", current_volume) or current_volume
-            volume_spike = current_volume / avg_volume if avg_volume > 0 else 1.0
-
-            return {
-                "name": info.get("shortName", ticker),
-                "price": info.get("regularMarketPrice") or info.get("previousClose", 0),
-                "market_cap": info.get("marketCap", 0),
-                "volume": int(current_volume),
-                "avg_volume": int(avg_volume),
-                "volume_spike": volume_spike,
-                "sector": info.get("sector", "Unknown"),
-            }
+            return self._build_stock_info(ticker, stock.info, stock.history(period="1mo"))
+        except Exception as e:
+            logger.warning("stock_info_failed", ticker=ticker, error=str(e))
+            return None
+
+    def _fetch_info(self, ticker: str) -> Optional[dict]:
+        """Fetch yfinance .info for one ticker (one HTTP call, not batchable)."""
+        import yfinance as yf
+
+        try:
+            return yf.Ticker(ticker).info
         except Exception as e:
             logger.warning("stock_info_failed", ticker=ticker, error=str(e))
             return None
 
+    def get_stock_info_batch(self, tickers: list[str]) -> dict[str, dict]:
+        """
+        Get stock info for many tickers at once.
+
+        Price history is downloaded in multi-ticker yf.download calls of
+        YF_BATCH_SIZE symbols; .info has no batch endpoint, so it is fetched
+        in parallel instead.
+
+        Returns:
+            Dict of ticker -> stock info, omitting tickers without data
+        """
+        results = {}
+        missing = []
+        for ticker in tickers:
+            cached = self.cache.get("stock_info", ticker, STOCK_INFO_TTL)
+            if cached is not None:
+                results[ticker] = cached
+            else:
+                missing.append(ticker)
+
+        if not missing:
+            return results
+
+        import yfinance as yf
+
+        histories = {}
+        for start in range(0, len(missing), YF_BATCH_SIZE):
+            chunk = missing[start:start + YF_BATCH_SIZE]
+            try:
+                data = yf.download(
+                    chunk, period="1mo", group_by="ticker", threads=True, progress=False
+                )
+            except Exception as e:
+                logger.warning("stock_history_batch_failed", tickers=chunk, error=str(e))
+                continue
+
+            for ticker in chunk:
+                try:
+                    hist = data[ticker] if data.columns.nlevels > 1 else data
+                    histories[ticker] = hist.dropna(how="all")
+                except KeyError:
+                    logger.debug("candidate_no_history", ticker=ticker)
+
+        fetch = [t for t, h in histories.items() if not h.empty]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            infos = executor.map(self._fetch_info, fetch)
+            for ticker, info in zip(fetch, infos):
+                try:
+                    stock_info = self._build_stock_info(ticker, info, histories[ticker])
+                except Exception as e:
+                    logger.warning("stock_info_failed", ticker=ticker, error=str(e))
+                    continue
+                if stock_info:
+                    results[ticker] = stock_info
+
+        return results
+
     def scan_reddit(
         self,
         subreddits: Optional[list[str]] = None,
@@ -120,9 +256,25 @@ class GemFinder:
         )
         return self.reddit_scanner.aggregate_mentions(mentions, min_mentions=2)
 
-    def validate_candidate(self, candidate: GemCandidate) -> Optional[GemStock]:
-        """Validate a gem candidate with market data."""
-        stock_info = self.get_stock_info(candidate.ticker)
+    def validate_candidate(
+        self,
+        candidate: GemCandidate,
+        stock_info: Optional[dict] = None,
+        fetch_buzz: bool = True,
+    ) -> Optional[GemStock]:
+        """
+        Validate a gem candidate with market data.
+
+        Args:
+            candidate: Aggregated Reddit candidate
+            stock_info: Prefetched stock info (fetched from yfinance if None)
+            fetch_buzz: Attach Finnhub buzz (find_gems fetches it in one batch instead)
+
+        Returns:
+            GemStock if the candidate passes the price/market cap filters
+        """
+        if stock_info is None:
+            stock_info = self.get_stock_info(candidate.ticker)
 
         if not stock_info:
             logger.debug("candidate_no_data", ticker=candidate.ticker)
@@ -141,7 +293,7 @@ class GemFinder:
             return None
 
         # Get Finnhub buzz
-        finnhub_buzz = self.get_finnhub_buzz(candidate.ticker)
+        finnhub_buzz = self.get_finnhub_buzz(candidate.ticker) if fetch_buzz else None
 
         return GemStock(
             ticker=candidate.ticker,
@@ -184,13 +336,31 @@ class GemFinder:
         candidates = self.scan_reddit(subreddits=subreddits)
         logger.info("candidates_found", count=len(candidates))
 
-        # Validate each candidate
+        # Drop everyday words before any network calls are made for them,
+        # unless someone explicitly wrote them as a $TICKER
+        found_count = len(candidates)
+        candidates = [
+            c for c in candidates
+            if c.ticker not in COMMON_WORDS or c.cashtag_count
+        ]
+        logger.info("candidates_prefiltered", dropped=found_count - len(candidates))
+
+        # Fetch market data for the top candidates in one batch
+        window = candidates[:limit * 4]
+        stock_infos = self.get_stock_info_batch([c.ticker for c in window])
+
+        # Validate in momentum order; filtering is local now that data is prefetched
         gems = []
-        for candidate in candidates:
+        for candidate in window:
             if len(gems) >= limit * 2:  # Get more than needed for filtering
                 break
 
-            gem = self.validate_candidate(candidate)
+            stock_info = stock_infos.get(candidate.ticker)
+            if not stock_info:
+                logger.debug("candidate_no_data", ticker=candidate.ticker)
+                continue
+
+            gem = self.validate_candidate(candidate, stock_info, fetch_buzz=False)
             if gem:
                 if require_volume_spike and gem.volume_spike < self.min_volume_spike:
                     continue
@@ -198,38 +368,20 @@ class GemFinder:
 
         # Sort by momentum + volume spike
         gems.sort(key=lambda g: g.momentum_score * (1 + g.volume_spike), reverse=True)
+        gems = gems[:limit]
 
-        logger.info("gems_found", count=len(gems[:limit]))
-        return gems[:limit]
+        # Attach Finnhub buzz for the returned gems in one concurrent batch
+        buzz = self.get_finnhub_buzz_batch([g.ticker for g in gems])
+        for gem in gems:
+            gem.finnhub_buzz = buzz.get(gem.ticker)
+
+        logger.info("gems_found", count=len(gems))
+        return gems
 
     def format_gem_message(self, gem: GemStock, lang: str = "de") -> str:
         """Format a gem for Telegram message."""
-        if lang == "en":
-            sentiment_map = {"bullish": "🟢 Bullish", "bearish": "🔴 Bearish", "neutral": "🟡 Neutral"}
-            labels = {
-                "price": "Price",
-                "market_cap": "Market Cap",
-                "volume": "Volume",
-                "volume_spike": "Volume Spike",
-                "mentions": "Reddit Mentions",
-                "sentiment": "Sentiment",
-                "subreddits": "Found in",
-                "sector": "Sector",
-                "sample": "Sample Posts",
-            }
-        else:
-            sentiment_map = {"bullish": "🟢 Bullish", "bearish": "🔴 Bearish", "neutral": "🟡 Neutral"}
-            labels = {
-                "price": "Kurs",
-                "market_cap": "Marktkapital",
-                "volume": "Volumen",
-                "volume_spike": "Volumen-Spike",
-                "mentions": "Reddit Erwähnungen",
-                "sentiment": "Sentiment",
-                "subreddits": "Gefunden in",
-                "sector": "Sektor",
-                "sample": "Beispiel-Posts",
-            }
+        labels = self._LABELS_EN if lang == "en" else self._LABELS_DE
+        sentiment_map = self._SENTIMENT_MAP
 
         # Format market cap
         cap = gem.market_cap
@@ -278,9 +430,10 @@ _{gem.name}_
             header = "🔥 *GEM SCANNER ERGEBNISSE*\n\n"
 
         lines = [header]
+        sentiment_emojis = self._SENTIMENT_EMOJI
 
         for i, gem in enumerate(gems[:5], 1):
-            sentiment_emoji = {"bullish": "🟢", "bearish": "🔴", "neutral": "🟡"}.get(gem.sentiment, "🟡")
+            sentiment_emoji = sentiment_emojis.get(gem.sentiment, "🟡")
             penny = "💎" if gem.is_penny_stock else ""
 
             lines.append(
@@ -2,20 +2,28 @@
 
 import os
 import re
-from collections import Counter
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding, falls back to requests' json
+    orjson = None
+
 logger = structlog.get_logger()
 
-# Common stock ticker pattern (1-5 uppercase letters)
-TICKER_PATTERN = re.compile(r'\b([A-Z]{1,5})\b')
+# Common stock ticker pattern (1-5 letters, any case); group 1 captures a $ prefix
+TICKER_PATTERN = re.compile(r'(\$)?\b([A-Z]{1,5})\b', re.IGNORECASE)
 
 # Words that look like tickers but aren't
-TICKER_BLACKLIST = {
+TICKER_BLACKLIST = frozenset({
     'I', 'A', 'BE', 'BY', 'DO', 'GO', 'HE', 'IF', 'IN', 'IS', 'IT', 'ME', 'MY',
     'NO', 'OF', 'OK', 'ON', 'OR', 'SO', 'TO', 'UP', 'US', 'WE', 'AM', 'AN', 'AS',
     'AT', 'CEO', 'CFO', 'CTO', 'DD', 'EPS', 'ETF', 'FDA', 'FUD', 'GDP', 'IMO',
@@ -31,7 +39,46 @@ TICKER_BLACKLIST = {
     'CALL', 'VERY', 'AFTER', 'MOST', 'ALSO', 'WEEK', 'TIME', 'VERY', 'WHEN',
     'COME', 'THESE', 'KNOW', 'MAKE', 'BACK', 'YEAR', 'WELL', 'EVEN', 'GOOD',
     'ANY', 'BEST', 'FYI', 'IDK', 'NFT', 'AI', 'UK', 'EU', 'TX', 'CA', 'NY',
-}
+})
+
+# Common words that pass the ticker filter and are not listed symbols. Words
+# that double as real tickers (OPEN, TRUE, LOVE, ...) are deliberately left
+# out. Kept out of TICKER_BLACKLIST so mention counts stay intact; GemFinder
+# drops these candidates before market-data lookups unless they were ever
+# written as $TICKER.
+COMMON_WORDS = frozenset({
+    'ABOUT', 'ABOVE', 'AGAIN', 'AGO', 'AHEAD', 'ALONE', 'ALONG', 'BASED', 'BEARS',
+    'BELOW', 'BOTH', 'BREAK', 'BRING', 'BUILT', 'BULLS', 'BUYS', 'CALLS', 'CHART',
+    'CHEAP', 'CLOSE', 'COULD', 'CRASH', 'DAILY', 'DAYS', 'DOES', 'DUMP', 'EACH',
+    'EARLY', 'ELSE', 'EVERY', 'FEW', 'FIRST', 'GAINS', 'GAVE', 'GOES', 'GOING',
+    'GONE', 'HAD', 'HALF', 'KEEP', 'KEPT', 'LATE', 'LEFT', 'LESS', 'LOSE', 'LOSS',
+    'LOST', 'MANY', 'MEAN', 'MIGHT', 'MISS', 'MONEY', 'MONTH', 'MUCH', 'MUST',
+    'NEED', 'NEVER', 'NONE', 'OFF', 'OFTEN', 'OTHER', 'PRICE', 'PUTS', 'QUITE',
+    'RALLY', 'SAID', 'SAME', 'SCAM', 'SELL', 'SELLS', 'SHORT', 'SINCE', 'SOLD',
+    'SOON', 'STILL', 'STOCK', 'THEIR', 'THERE', 'THING', 'THINK', 'THOSE', 'TODAY',
+    'TOLD', 'TOOK', 'TOTAL', 'TRADE', 'UNDER', 'UNTIL', 'UPON', 'VALUE', 'WAIT',
+    'WATCH', 'WEEKS', 'WENT', 'WERE', 'WHERE', 'WHICH', 'WHILE', 'WHY', 'WORTH',
+    'WOULD', 'WRONG',
+})
+
+# Sentiment keywords, matched as substrings of the lowercased post title
+BULLISH_KEYWORDS = (
+    'moon', 'rocket', '🚀', 'buy', 'long', 'calls', 'bullish',
+    'undervalued', 'gem', 'hidden', 'squeeze', 'breakout', 'tendies',
+    'gains', 'profit', 'up', 'green', 'pumping', 'mooning'
+)
+
+BEARISH_KEYWORDS = (
+    'sell', 'short', 'puts', 'bearish', 'overvalued', 'dump',
+    'crash', 'red', 'loss', 'down', 'avoid', 'scam', 'fraud',
+    'bag', 'bagholding', 'rip'
+)
+
+# Per-post analysis: sentiment is computed once per post instead of once per
+# ticker it mentions. The ID cache only saves work if a scanner instance is
+# reused for repeated scans; crossposts carry their own IDs and never hit it.
+POST_CACHE_TTL = 60 * 60  # seconds
+POST_CACHE_SIZE = 10_000
 
 # Subreddits to scan
 STOCK_SUBREDDITS = [
@@ -57,6 +104,7 @@ class TickerMention:
     created_utc: datetime
     url: str
     sentiment_hint: str = "neutral"  # Based on keywords
+    is_cashtag: bool = False  # Written as $TICKER
 
 
 @dataclass
@@ -70,6 +118,7 @@ class GemCandidate:
     avg_sentiment: str
     momentum_score: float  # How much it's trending
     sample_posts: list[str]
+    cashtag_count: int = 0  # Mentions written as $TICKER
 
 
 class RedditScanner:
@@ -91,6 +140,9 @@ class RedditScanner:
         self.user_agent = user_agent or os.getenv("REDDIT_USER_AGENT", "trading-crew-scanner/1.0")
 
         self.reddit = None
+        self._session = None
+        self._post_cache: OrderedDict[str, tuple[dict[str, bool], str, float]] = OrderedDict()
+        self._post_cache_lock = threading.Lock()  # Subreddits are scanned in parallel
         self._init_praw()
 
     def _init_praw(self) -> None:
@@ -111,40 +163,33 @@ class RedditScanner:
         else:
             logger.info("reddit_no_credentials", fallback="public_json_api")
 
-    def _extract_tickers(self, text: str) -> list[str]:
-        """Extract potential stock tickers from text."""
-        # Find $TICKER format first (more reliable)
-        dollar_tickers = re.findall(r'\$([A-Z]{1,5})\b', text.upper())
-
-        # Then find standalone uppercase words
-        raw_tickers = TICKER_PATTERN.findall(text.upper())
-
-        # Filter out blacklisted words
-        valid_tickers = [
-            t for t in (dollar_tickers + raw_tickers)
-            if t not in TICKER_BLACKLIST and len(t) >= 2
-        ]
-
-        return list(set(valid_tickers))
+    def _get_session(self):
+        """Get a shared requests session so connections are reused across scans."""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.headers["User-Agent"] = self.user_agent
+        return self._session
+
+    def _extract_tickers(self, text: str) -> dict[str, bool]:
+        """Extract potential stock tickers from text, mapped to whether any was written as $TICKER."""
+        # Single pass covers both $TICKER and standalone words
+        blacklist = TICKER_BLACKLIST
+        tickers: dict[str, bool] = {}
+        for match in TICKER_PATTERN.finditer(text):
+            ticker = match.group(2).upper()
+            if len(ticker) >= 2 and ticker not in blacklist:
+                tickers[ticker] = tickers.get(ticker, False) or match.group(1) is not None
+
+        return tickers
 
     def _analyze_sentiment(self, text: str) -> str:
         """Simple keyword-based sentiment analysis."""
         text_lower = text.lower()
 
-        bullish_keywords = [
-            'moon', 'rocket', '🚀', 'buy', 'long', 'calls', 'bullish',
-            'undervalued', 'gem', 'hidden', 'squeeze', 'breakout', 'tendies',
-            'gains', 'profit', 'up', 'green', 'pumping', 'mooning'
-        ]
-
-        bearish_keywords = [
-            'sell', 'short', 'puts', 'bearish', 'overvalued', 'dump',
-            'crash', 'red', 'loss', 'down', 'avoid', 'scam', 'fraud',
-            'bag', 'bagholding', 'rip'
-        ]
-
-        bullish_count = sum(1 for kw in bullish_keywords if kw in text_lower)
-        bearish_count = sum(1 for kw in bearish_keywords if kw in text_lower)
+        # Substring checks run in C; on post-sized text they beat a combined regex scan
+        bullish_count = len([kw for kw in BULLISH_KEYWORDS if kw in text_lower])
+        bearish_count = len([kw for kw in BEARISH_KEYWORDS if kw in text_lower])
 
         if bullish_count > bearish_count + 1:
             return "bullish"
@@ -152,6 +197,29 @@ class RedditScanner:
             return "bearish"
         return "neutral"
 
+    def _analyze_post(self, post_id: str, title: str, selftext: str) -> tuple[dict[str, bool], str]:
+        """Get (tickers, sentiment) for a post, computing sentiment once for all its tickers."""
+        now = time.time()
+        if post_id:
+            with self._post_cache_lock:
+                cached = self._post_cache.get(post_id)
+                if cached:
+                    self._post_cache.move_to_end(post_id)
+            if cached and now - cached[2] < POST_CACHE_TTL:
+                return cached[0], cached[1]
+
+        tickers = self._extract_tickers(title + " " + selftext)
+        sentiment = self._analyze_sentiment(title) if tickers else "neutral"
+
+        if post_id:
+            with self._post_cache_lock:
+                self._post_cache[post_id] = (tickers, sentiment, now)
+                self._post_cache.move_to_end(post_id)
+                while len(self._post_cache) > POST_CACHE_SIZE:
+                    self._post_cache.popitem(last=False)
+
+        return tickers, sentiment
+
     def scan_subreddit_praw(
         self,
         subreddit_name: str,
@@ -168,8 +236,8 @@ class RedditScanner:
 
             # Get hot and new posts
             for post in subreddit.hot(limit=limit):
-                tickers = self._extract_tickers(post.title + " " + (post.selftext or ""))
-                for ticker in tickers:
+                tickers, sentiment = self._analyze_post(post.id, post.title, post.selftext or "")
+                for ticker, is_cashtag in tickers.items():
                     mentions.append(TickerMention(
                         ticker=ticker,
                         title=post.title[:200],
@@ -178,7 +246,8 @@ class RedditScanner:
                         num_comments=post.num_comments,
                         created_utc=datetime.fromtimestamp(post.created_utc),
                         url=f"https://reddit.com{post.permalink}",
-                        sentiment_hint=self._analyze_sentiment(post.title),
+                        sentiment_hint=sentiment,
+                        is_cashtag=is_cashtag,
                     ))
 
             logger.info("subreddit_scanned", subreddit=subreddit_name, mentions=len(mentions))
@@ -194,24 +263,21 @@ class RedditScanner:
         limit: int = 25
     ) -> list[TickerMention]:
         """Scan a subreddit using public JSON API (no auth needed, limited)."""
-        import requests
-
         mentions = []
         try:
             url = f"https://www.reddit.com/r/{subreddit_name}/hot.json?limit={limit}"
-            headers = {"User-Agent": self.user_agent}
 
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._get_session().get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
 
             for post in data.get("data", {}).get("children", []):
                 post_data = post.get("data", {})
                 title = post_data.get("title", "")
                 selftext = post_data.get("selftext", "")
 
-                tickers = self._extract_tickers(title + " " + selftext)
-                for ticker in tickers:
+                tickers, sentiment = self._analyze_post(post_data.get("id", ""), title, selftext)
+                for ticker, is_cashtag in tickers.items():
                     mentions.append(TickerMention(
                         ticker=ticker,
                         title=title[:200],
@@ -220,7 +286,8 @@ class RedditScanner:
                         num_comments=post_data.get("num_comments", 0),
                         created_utc=datetime.fromtimestamp(post_data.get("created_utc", 0)),
                         url=f"https://reddit.com{post_data.get('permalink', '')}",
-                        sentiment_hint=self._analyze_sentiment(title),
+                        sentiment_hint=sentiment,
+                        is_cashtag=is_cashtag,
                     ))
 
             logger.info("subreddit_scanned_json", subreddit=subreddit_name, mentions=len(mentions))
@@ -239,12 +306,22 @@ class RedditScanner:
         subreddits = subreddits or STOCK_SUBREDDITS
         all_mentions = []
 
-        for sub in subreddits:
-            if self.reddit:
-                mentions = self.scan_subreddit_praw(sub, limit=limit_per_sub)
-            else:
-                mentions = self.scan_subreddit_json(sub, limit=min(limit_per_sub, 25))
-            all_mentions.extend(mentions)
+        if self.reddit:
+            # PRAW is not thread-safe and rate-limits itself, so stay sequential
+            for sub in subreddits:
+                all_mentions.extend(self.scan_subreddit_praw(sub, limit=limit_per_sub))
+            return all_mentions
+
+        # Public JSON API is network-bound: fetch all subreddits concurrently
+        json_limit = min(limit_per_sub, 25)
+        self._get_session()  # create once before the workers share it
+        with ThreadPoolExecutor(max_workers=len(subreddits)) as executor:
+            results = executor.map(
+                lambda sub: self.scan_subreddit_json(sub, limit=json_limit),
+                subreddits,
+            )
+            for mentions in results:
+                all_mentions.extend(mentions)
 
         return all_mentions
 
@@ -264,7 +341,10 @@ class RedditScanner:
                     "subreddits": set(),
                     "total_score": 0,
                     "total_comments": 0,
-                    "sentiments": [],
+                    "bullish": 0,
+                    "bearish": 0,
+                    "neutral": 0,
+                    "cashtags": 0,
                     "sample_posts": [],
                 }
 
@@ -273,7 +353,10 @@ class RedditScanner:
             data["subreddits"].add(mention.subreddit)
             data["total_score"] += mention.score
             data["total_comments"] += mention.num_comments
-            data["sentiments"].append(mention.sentiment_hint)
+            sentiment = mention.sentiment_hint
+            data[sentiment if sentiment in ("bullish", "bearish") else "neutral"] += 1
+            if mention.is_cashtag:
+                data["cashtags"] += 1
 
             if len(data["sample_posts"]) < 3:
                 data["sample_posts"].append(mention.title)
@@ -286,10 +369,9 @@ class RedditScanner:
                 continue
 
             # Calculate average sentiment
-            sentiment_counts = Counter(data["sentiments"])
-            if sentiment_counts["bullish"] > sentiment_counts["bearish"]:
+            if data["bullish"] > data["bearish"]:
                 avg_sentiment = "bullish"
-            elif sentiment_counts["bearish"] > sentiment_counts["bullish"]:
+            elif data["bearish"] > data["bullish"]:
                 avg_sentiment = "bearish"
             else:
                 avg_sentiment = "neutral"
@@ -311,6 +393,7 @@ class RedditScanner:
                 avg_sentiment=avg_sentiment,
                 momentum_score=momentum,
                 sample_posts=data["sample_posts"],
+                cashtag_count=data["cashtags"],
             ))
 
         # Sort by momentum score
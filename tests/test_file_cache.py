@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the GEM scanner's FileCache
+
+Run with: python3 -m pytest tests/test_file_cache.py -v
+Or simply: python3 tests/test_file_cache.py
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scanner.file_cache import FileCache
+
+
+def test_ttl_expiry(tmp_path):
+    """Test TTL is applied on read."""
+    cache = FileCache(str(tmp_path))
+
+    # Test 1: Frischer Eintrag
+    cache.set("ns", "key", {"value": 1})
+    result = cache.get("ns", "key", ttl=60)
+    assert result == {"value": 1}, f"Expected cached value, got: {result}"
+
+    # Test 2: Abgelaufen (TTL 0)
+    result = cache.get("ns", "key", ttl=0)
+    assert result is None, f"Expected expired entry, got: {result}"
+
+    # Test 3: Alter Eintrag auf Disk
+    path = tmp_path / "ns" / "old.json"
+    path.write_text(json.dumps({"ts": time.time() - 120, "data": "stale"}), encoding="utf-8")
+    result = FileCache(str(tmp_path)).get("ns", "old", ttl=60)
+    assert result is None, f"Expected expired disk entry, got: {result}"
+
+    print("✅ ttl_expiry: ALL TESTS PASSED")
+
+
+def test_missing_or_corrupt(tmp_path):
+    """Test missing and unreadable files return None."""
+    cache = FileCache(str(tmp_path))
+
+    # Test 1: Fehlende Datei
+    result = cache.get("ns", "missing", ttl=60)
+    assert result is None, f"Expected None for missing file, got: {result}"
+
+    # Test 2: Kaputtes JSON
+    (tmp_path / "ns").mkdir(parents=True, exist_ok=True)
+    (tmp_path / "ns" / "broken.json").write_text("{not json", encoding="utf-8")
+    result = cache.get("ns", "broken", ttl=60)
+    assert result is None, f"Expected None for corrupt file, got: {result}"
+
+    print("✅ missing_or_corrupt: ALL TESTS PASSED")
+
+
+def test_lru_eviction(tmp_path):
+    """Test in-memory LRU evicts at memory_size and promotes on read."""
+    cache = FileCache(str(tmp_path), memory_size=2)
+    cache.set("ns", "a", 1)
+    cache.set("ns", "b", 2)
+
+    # Test 1: Lesen befördert "a", daher wird "b" verdrängt
+    cache.get("ns", "a", ttl=60)
+    cache.set("ns", "c", 3)
+    keys = [key for _, key in cache._memory]
+    assert keys == ["a", "c"], f"Expected ['a', 'c'] in memory, got: {keys}"
+
+    # Test 2: Verdrängter Eintrag kommt weiterhin von Disk
+    result = cache.get("ns", "b", ttl=60)
+    assert result == 2, f"Expected evicted entry from disk, got: {result}"
+    assert len(cache._memory) == 2, f"Expected memory capped at 2, got: {len(cache._memory)}"
+
+    print("✅ lru_eviction: ALL TESTS PASSED")
+
+
+def test_cross_instance_read(tmp_path):
+    """Test a second cache instance reads entries written by the first."""
+    FileCache(str(tmp_path)).set("stock_info", "GME", {"price": 20.0})
+
+    other = FileCache(str(tmp_path))
+    assert not other._memory, "Expected fresh instance to start with empty memory"
+    result = other.get("stock_info", "GME", ttl=60)
+    assert result == {"price": 20.0}, f"Expected value from disk, got: {result}"
+
+    print("✅ cross_instance_read: ALL TESTS PASSED")
+
+
+def test_returns_copies(tmp_path):
+    """Test callers mutating a result don't change the cached value."""
+    cache = FileCache(str(tmp_path))
+    value = {"price": 1.0, "tags": ["a"]}
+    cache.set("ns", "key", value)
+
+    # Test 1: Original nach set() verändern
+    value["price"] = 99.0
+    result = cache.get("ns", "key", ttl=60)
+    assert result == {"price": 1.0, "tags": ["a"]}, f"Expected stored value, got: {result}"
+
+    # Test 2: Ergebnis von get() verändern
+    result["tags"].append("b")
+    again = cache.get("ns", "key", ttl=60)
+    assert again == {"price": 1.0, "tags": ["a"]}, f"Expected unchanged value, got: {again}"
+    assert again is not result, "Expected a fresh object on every hit"
+
+    print("✅ returns_copies: ALL TESTS PASSED")
+
+
+def test_failed_write_cleans_up(tmp_path):
+    """Test a failed rename leaves no temp files behind."""
+    cache = FileCache(str(tmp_path))
+
+    with mock.patch("os.replace", side_effect=OSError("disk full")):
+        cache.set("ns", "key", {"value": 1})
+
+    leftovers = list(tmp_path.rglob("*.tmp"))
+    assert not leftovers, f"Expected no temp files, got: {leftovers}"
+
+    print("✅ failed_write_cleans_up: ALL TESTS PASSED")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    print("\n" + "=" * 50)
+    print("Running FileCache Unit Tests")
+    print("=" * 50 + "\n")
+
+    tests = [
+        test_ttl_expiry,
+        test_missing_or_corrupt,
+        test_lru_eviction,
+        test_cross_instance_read,
+        test_returns_copies,
+        test_failed_write_cleans_up,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                test(Path(tmp_dir))
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: FAILED - {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: ERROR - {e}")
+            failed += 1
+
+    print("\n" + "=" * 50)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 50 + "\n")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
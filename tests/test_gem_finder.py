@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the GEM scanner's GemFinder market-data path
+
+Run with: python3 -m pytest tests/test_gem_finder.py -v
+Or simply: python3 tests/test_gem_finder.py
+"""
+
+import sys
+import tempfile
+import types
+from pathlib import Path
+from unittest import mock
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scanner.gem_finder import GemFinder
+from src.scanner.reddit_scanner import GemCandidate
+
+
+class _FakeHistory:
+    """Minimal stand-in for the yfinance history DataFrame."""
+
+    def __init__(self, volumes):
+        self._volumes = volumes
+
+    @property
+    def empty(self):
+        return not self._volumes
+
+    def __getitem__(self, column):
+        return types.SimpleNamespace(iloc=self._volumes)
+
+    def dropna(self, how="any"):
+        return self
+
+
+class _FakeDownload:
+    """Minimal stand-in for a multi-ticker yf.download result."""
+
+    columns = types.SimpleNamespace(nlevels=2)
+
+    def __init__(self, histories):
+        self._histories = histories
+
+    def __getitem__(self, ticker):
+        return self._histories[ticker]
+
+
+def _candidate(ticker, cashtag_count=0):
+    return GemCandidate(
+        ticker=ticker,
+        mention_count=5,
+        total_score=100,
+        total_comments=20,
+        subreddits=["pennystocks"],
+        avg_sentiment="bullish",
+        momentum_score=10.0,
+        sample_posts=[f"{ticker} to the moon"],
+        cashtag_count=cashtag_count,
+    )
+
+
+def test_build_stock_info(tmp_path):
+    """Test stock info dict built from yfinance info + history."""
+    finder = GemFinder(cache_dir=str(tmp_path))
+    info = {
+        "shortName": "Test Corp",
+        "regularMarketPrice": 2.5,
+        "marketCap": 50_000_000,
+        "averageVolume": 1000,
+        "sector": "Technology",
+    }
+
+    # Test 1: Volumen-Spike aus letztem Volumen / Durchschnitt
+    result = finder._build_stock_info("TST", info, _FakeHistory([500, 3000]))
+    assert result["volume"] == 3000, f"Expected volume 3000, got: {result['volume']}"
+    assert result["volume_spike"] == 3.0, f"Expected spike 3.0, got: {result['volume_spike']}"
+    assert result["name"] == "Test Corp", f"Expected name, got: {result['name']}"
+
+    # Test 2: Ergebnis landet im Cache
+    cached = finder.cache.get("stock_info", "TST", ttl=60)
+    assert cached == result, f"Expected cached stock info, got: {cached}"
+
+    # Test 3: Leere Historie oder fehlende Info
+    assert finder._build_stock_info("TST", info, _FakeHistory([])) is None, "Expected None for empty history"
+    assert finder._build_stock_info("TST", {}, _FakeHistory([100])) is None, "Expected None for missing info"
+
+    print("✅ build_stock_info: ALL TESTS PASSED")
+
+
+def test_find_gems(tmp_path):
+    """Test find_gems with yfinance and Reddit stubbed out."""
+    finder = GemFinder(cache_dir=str(tmp_path))
+    finder.finnhub_api_key = None
+    finder.scan_reddit = lambda subreddits=None: [
+        _candidate("GEMX"),
+        _candidate("MONEY", cashtag_count=1),  # Common word, but written as $MONEY
+        _candidate("STILL"),  # Common word, never a cashtag
+        _candidate("GONE"),
+        _candidate("NODAT", cashtag_count=1),  # Empty history
+        _candidate("BIGCO", cashtag_count=1),  # Above max_price
+    ]
+
+    downloaded = []
+    info_fetched = []
+    infos = {
+        "GEMX": {"regularMarketPrice": 1.5, "marketCap": 10_000_000, "averageVolume": 100},
+        "MONEY": {"regularMarketPrice": 3.0, "marketCap": 20_000_000, "averageVolume": 100},
+        "BIGCO": {"regularMarketPrice": 500.0, "marketCap": 30_000_000, "averageVolume": 100},
+    }
+
+    def download(tickers, **kwargs):
+        downloaded.extend(tickers)
+        return _FakeDownload({
+            t: _FakeHistory([] if t == "NODAT" else [100, 200]) for t in tickers
+        })
+
+    def ticker(symbol):
+        info_fetched.append(symbol)
+        return types.SimpleNamespace(info=infos.get(symbol, {}))
+
+    fake_yf = types.SimpleNamespace(download=download, Ticker=ticker)
+    with mock.patch.dict(sys.modules, {"yfinance": fake_yf}):
+        gems = finder.find_gems(limit=5)
+
+    # Test 1: Alltagswörter ohne Cashtag werden nie angefragt
+    assert "STILL" not in downloaded, f"Expected STILL filtered, downloaded: {downloaded}"
+    assert "GONE" not in downloaded, f"Expected GONE filtered, downloaded: {downloaded}"
+
+    # Test 2: Leere Historie löst keinen .info-Abruf aus
+    assert "NODAT" not in info_fetched, f"Expected no .info for NODAT, fetched: {info_fetched}"
+
+    # Test 3: Ergebnis enthält nur gültige Kandidaten
+    tickers = sorted(g.ticker for g in gems)
+    assert tickers == ["GEMX", "MONEY"], f"Expected ['GEMX', 'MONEY'], got: {tickers}"
+    assert all(g.volume_spike == 2.0 for g in gems), f"Expected spike 2.0, got: {gems}"
+
+    print("✅ find_gems: ALL TESTS PASSED")
+
+
+def test_finnhub_buzz_batch(tmp_path):
+    """Test Finnhub buzz is fetched over one shared session and cached."""
+    finder = GemFinder(cache_dir=str(tmp_path), finnhub_api_key="test-key")
+    requested = []
+
+    def get(url, params=None, timeout=None):
+        requested.append(params["symbol"])
+        return types.SimpleNamespace(ok=True, json=lambda: {"symbol": params["symbol"]})
+
+    session = types.SimpleNamespace(get=get)
+    finder._session = session
+
+    # Test 1: Alle Ticker über dieselbe Session
+    result = finder.get_finnhub_buzz_batch(["GEMX", "MONEY", "BIGCO"])
+    assert sorted(requested) == ["BIGCO", "GEMX", "MONEY"], f"Expected 3 requests, got: {requested}"
+    assert result["GEMX"] == {"symbol": "GEMX"}, f"Expected buzz for GEMX, got: {result}"
+    assert finder._get_session() is session, "Expected the session to be reused"
+
+    # Test 2: Zweiter Aufruf kommt aus dem Cache
+    finder.get_finnhub_buzz_batch(["GEMX"])
+    assert len(requested) == 3, f"Expected cache hit, got requests: {requested}"
+
+    print("✅ finnhub_buzz_batch: ALL TESTS PASSED")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    print("\n" + "=" * 50)
+    print("Running GemFinder Unit Tests")
+    print("=" * 50 + "\n")
+
+    tests = [
+        test_build_stock_info,
+        test_find_gems,
+        test_finnhub_buzz_batch,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                test(Path(tmp_dir))
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: FAILED - {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: ERROR - {e}")
+            failed += 1
+
+    print("\n" + "=" * 50)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 50 + "\n")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
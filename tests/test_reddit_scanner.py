@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the GEM scanner's RedditScanner
+
+Run with: python3 -m pytest tests/test_reddit_scanner.py -v
+Or simply: python3 tests/test_reddit_scanner.py
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scanner.reddit_scanner import POST_CACHE_TTL, RedditScanner, TickerMention
+
+
+class _FakeResponse:
+    """Minimal stand-in for a requests.Response with a JSON body."""
+
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _FakeSession:
+    """Returns the same listing for every subreddit."""
+
+    def __init__(self, posts):
+        self._payload = {"data": {"children": [{"data": post} for post in posts]}}
+
+    def get(self, url, timeout=None):
+        return _FakeResponse(self._payload)
+
+
+def _scanner():
+    scanner = RedditScanner()
+    scanner.reddit = None  # Force the public JSON path even if credentials are set
+    return scanner
+
+
+def _mention(ticker, sentiment="neutral", is_cashtag=False, subreddit="pennystocks"):
+    return TickerMention(
+        ticker=ticker,
+        title=f"{ticker} post",
+        subreddit=subreddit,
+        score=10,
+        num_comments=2,
+        created_utc=datetime(2024, 1, 1),
+        url="https://reddit.com/r/test",
+        sentiment_hint=sentiment,
+        is_cashtag=is_cashtag,
+    )
+
+
+def test_extract_tickers():
+    """Test ticker extraction and $TICKER detection."""
+    scanner = _scanner()
+
+    # Test 1: $-Präfix wird erkannt, Groß-/Kleinschreibung egal
+    result = scanner._extract_tickers("$gme GME amc")
+    assert result == {"GME": True, "AMC": False}, f"Expected GME cashtag, got: {result}"
+
+    # Test 2: Cashtag später im Text zählt ebenfalls
+    result = scanner._extract_tickers("gme and then $GME")
+    assert result == {"GME": True}, f"Expected GME cashtag, got: {result}"
+
+    # Test 3: Blacklist und Einzelbuchstaben
+    result = scanner._extract_tickers("YOLO: THE CEO and a DD for I")
+    assert result == {}, f"Expected no tickers, got: {result}"
+
+    print("✅ extract_tickers: ALL TESTS PASSED")
+
+
+def test_aggregate_cashtag_count():
+    """Test the $TICKER flag survives scanning and aggregation."""
+    scanner = _scanner()
+    scanner._session = _FakeSession([
+        {"id": "p1", "title": "$GME squeeze incoming", "selftext": "GME again"},
+        {"id": "p2", "title": "Thoughts on $GME", "selftext": ""},
+        {"id": "p3", "title": "AMC or GME", "selftext": ""},
+        {"id": "p4", "title": "AMC still alive", "selftext": ""},
+    ])
+
+    mentions = scanner.scan_subreddit_json("pennystocks")
+    candidates = {c.ticker: c for c in scanner.aggregate_mentions(mentions)}
+
+    # Test 1: Zwei Posts schreiben $GME, einer nur GME
+    gme = candidates["GME"]
+    assert gme.mention_count == 3, f"Expected 3 GME mentions, got: {gme.mention_count}"
+    assert gme.cashtag_count == 2, f"Expected 2 GME cashtags, got: {gme.cashtag_count}"
+
+    # Test 2: Ohne $-Präfix bleibt der Zähler bei 0
+    amc = candidates["AMC"]
+    assert amc.cashtag_count == 0, f"Expected 0 AMC cashtags, got: {amc.cashtag_count}"
+
+    print("✅ aggregate_cashtag_count: ALL TESTS PASSED")
+
+
+def test_aggregate_sentiment_tallies():
+    """Test bullish/bearish tallies decide the average sentiment."""
+    scanner = _scanner()
+    mentions = [
+        _mention("BULLX", "bullish"),
+        _mention("BULLX", "bullish"),
+        _mention("BULLX", "bearish"),
+        _mention("BEARX", "bearish"),
+        _mention("BEARX", "bearish"),
+        _mention("BEARX", "neutral"),
+        _mention("EVENX", "bullish"),
+        _mention("EVENX", "bearish"),
+        _mention("EVENX", "unknown"),  # Unbekannte Werte zählen als neutral
+        _mention("ONCEX", "bullish"),
+    ]
+
+    candidates = {c.ticker: c for c in scanner.aggregate_mentions(mentions, min_mentions=2)}
+
+    # Test 1: Mehrheit entscheidet
+    assert candidates["BULLX"].avg_sentiment == "bullish", f"Got: {candidates['BULLX'].avg_sentiment}"
+    assert candidates["BEARX"].avg_sentiment == "bearish", f"Got: {candidates['BEARX'].avg_sentiment}"
+
+    # Test 2: Gleichstand ist neutral
+    assert candidates["EVENX"].avg_sentiment == "neutral", f"Got: {candidates['EVENX'].avg_sentiment}"
+
+    # Test 3: min_mentions filtert Einzelnennungen
+    assert "ONCEX" not in candidates, f"Expected ONCEX filtered, got: {list(candidates)}"
+
+    print("✅ aggregate_sentiment_tallies: ALL TESTS PASSED")
+
+
+def test_post_cache_ttl():
+    """Test cached post analysis expires after POST_CACHE_TTL."""
+    scanner = _scanner()
+    extract = mock.Mock(wraps=scanner._extract_tickers)
+    scanner._extract_tickers = extract
+
+    # Test 1: Innerhalb der TTL aus dem Cache
+    with mock.patch("time.time", return_value=1000.0):
+        scanner._analyze_post("p1", "$GME squeeze", "")
+    with mock.patch("time.time", return_value=1000.0 + POST_CACHE_TTL - 1):
+        result = scanner._analyze_post("p1", "$GME squeeze", "")
+    assert extract.call_count == 1, f"Expected cache hit, got {extract.call_count} extractions"
+    assert result == ({"GME": True}, "neutral"), f"Expected cached result, got: {result}"
+
+    # Test 2: Nach Ablauf neu berechnet
+    with mock.patch("time.time", return_value=1000.0 + POST_CACHE_TTL):
+        scanner._analyze_post("p1", "$GME squeeze", "")
+    assert extract.call_count == 2, f"Expected recompute, got {extract.call_count} extractions"
+
+    print("✅ post_cache_ttl: ALL TESTS PASSED")
+
+
+def test_post_cache_eviction():
+    """Test the least recently used post ID is evicted at POST_CACHE_SIZE."""
+    scanner = _scanner()
+
+    with mock.patch("src.scanner.reddit_scanner.POST_CACHE_SIZE", 2):
+        scanner._analyze_post("p1", "GME", "")
+        scanner._analyze_post("p2", "AMC", "")
+        scanner._analyze_post("p1", "GME", "")  # Treffer befördert p1
+        scanner._analyze_post("p3", "BB", "")
+
+    keys = list(scanner._post_cache)
+    assert keys == ["p1", "p3"], f"Expected p2 evicted, got: {keys}"
+
+    print("✅ post_cache_eviction: ALL TESTS PASSED")
+
+
+def test_post_cache_requires_id():
+    """Test posts without an ID bypass the cache."""
+    scanner = _scanner()
+    extract = mock.Mock(wraps=scanner._extract_tickers)
+    scanner._extract_tickers = extract
+
+    scanner._analyze_post("", "GME", "")
+    scanner._analyze_post("", "GME", "")
+
+    assert extract.call_count == 2, f"Expected no caching, got {extract.call_count} extractions"
+    assert not scanner._post_cache, f"Expected empty cache, got: {list(scanner._post_cache)}"
+
+    print("✅ post_cache_requires_id: ALL TESTS PASSED")
+
+
+def run_all_tests():
+    """Run all unit tests."""
+    print("\n" + "=" * 50)
+    print("Running RedditScanner Unit Tests")
+    print("=" * 50 + "\n")
+
+    tests = [
+        test_extract_tickers,
+        test_aggregate_cashtag_count,
+        test_aggregate_sentiment_tallies,
+        test_post_cache_ttl,
+        test_post_cache_eviction,
+        test_post_cache_requires_id,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: FAILED - {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: ERROR - {e}")
+            failed += 1
+
+    print("\n" + "=" * 50)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 50 + "\n")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)